@@ -29,6 +29,9 @@ class ProjectDirs:
 
     def __init__(self, *, work_dir: Union[Path, str] = "."):
         self._work_dir = Path(work_dir).absolute()
+        self._parts_dir = self._work_dir / "parts"
+        self._stage_dir = self._work_dir / "stage"
+        self._prime_dir = self._work_dir / "prime"
 
     @property
     def work_dir(self) -> Path:
@@ -38,14 +41,14 @@ class ProjectDirs:
     @property
     def parts_dir(self) -> Path:
         """Return the directory containing work subdirectories for each part."""
-        return self._work_dir / "parts"
+        return self._parts_dir
 
     @property
     def stage_dir(self) -> Path:
         """Return the staging area containing installed files from all parts."""
-        return self._work_dir / "stage"
+        return self._stage_dir
 
     @property
     def prime_dir(self) -> Path:
         """Return the primed tree containing the final artifacts to deploy."""
-        return self._work_dir / "prime"
+        return self._prime_dir
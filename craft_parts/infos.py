@@ -16,10 +16,12 @@
 
 """Project, part and step information classes."""
 
+import functools
 import logging
 import platform
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from craft_parts import errors
 from craft_parts.dirs import ProjectDirs
@@ -46,6 +48,20 @@ class ProjectInfo:
         when creating a :class:`LifecycleManager`.
     """
 
+    __slots__ = (
+        "_application_name",
+        "_cache_dir",
+        "_host_arch",
+        "_arch",
+        "_arch_triplet",
+        "_target_arch",
+        "_is_cross_compiling",
+        "_base",
+        "_parallel_build_count",
+        "_dirs",
+        "_custom_args",
+    )
+
     def __init__(
         self,
         *,
@@ -95,12 +111,12 @@ class ProjectInfo:
     @property
     def arch_triplet(self) -> str:
         """Return the machine-vendor-os platform triplet definition."""
-        return self._machine["triplet"]
+        return self._arch_triplet
 
     @property
     def is_cross_compiling(self) -> bool:
         """Whether the target and host architectures are different."""
-        return self._arch != self._host_arch
+        return self._is_cross_compiling
 
     @property
     def parallel_build_count(self) -> int:
@@ -110,7 +126,7 @@ class ProjectInfo:
     @property
     def target_arch(self) -> str:
         """Return the architecture used for debs, snaps and charms."""
-        return self._machine["deb"]
+        return self._target_arch
 
     @property
     def base(self) -> str:
@@ -160,7 +176,9 @@ class ProjectInfo:
             raise errors.InvalidArchitecture(arch)
 
         self._arch = arch
-        self._machine = machine
+        self._arch_triplet = machine["triplet"]
+        self._target_arch = machine["deb"]
+        self._is_cross_compiling = arch != self._host_arch
 
 
 class PartInfo:
@@ -170,6 +188,17 @@ class PartInfo:
     :param part: The part we want to obtain information from.
     """
 
+    __slots__ = (
+        "_project_info",
+        "_part_name",
+        "_part_src_dir",
+        "_part_src_subdir",
+        "_part_build_dir",
+        "_part_build_subdir",
+        "_part_install_dir",
+        "_part_state_dir",
+    )
+
     def __init__(
         self,
         project_info: ProjectInfo,
@@ -192,6 +221,49 @@ class PartInfo:
 
         raise AttributeError(f"{self.__class__.__name__!r} has no attribute {name!r}")
 
+    # Frequently used project properties are forwarded explicitly to avoid
+    # the attribute cascading overhead.
+
+    @property
+    def application_name(self) -> str:
+        """Return the name of the application using craft-parts."""
+        return self._project_info.application_name
+
+    @property
+    def cache_dir(self) -> Path:
+        """Return the directory used to store cached files."""
+        return self._project_info.cache_dir
+
+    @property
+    def arch_triplet(self) -> str:
+        """Return the machine-vendor-os platform triplet definition."""
+        return self._project_info.arch_triplet
+
+    @property
+    def target_arch(self) -> str:
+        """Return the architecture used for debs, snaps and charms."""
+        return self._project_info.target_arch
+
+    @property
+    def parallel_build_count(self) -> int:
+        """Return the maximum allowable number of concurrent build jobs."""
+        return self._project_info.parallel_build_count
+
+    @property
+    def project_options(self) -> Dict[str, Any]:
+        """Obtain a project-wide options dictionary."""
+        return self._project_info.project_options
+
+    @property
+    def stage_dir(self) -> Path:
+        """Return the staging area containing installed files from all parts."""
+        return self._project_info.dirs.stage_dir
+
+    @property
+    def prime_dir(self) -> Path:
+        """Return the primed tree containing the final artifacts to deploy."""
+        return self._project_info.dirs.prime_dir
+
     @property
     def part_name(self) -> str:
         """Return the name of the part we're providing information about."""
@@ -245,6 +317,8 @@ class StepInfo:
     :param step: The step we want to obtain information from.
     """
 
+    __slots__ = ("_part_info", "step")
+
     def __init__(
         self,
         part_info: PartInfo,
@@ -259,6 +333,74 @@ class StepInfo:
 
         raise AttributeError(f"{self.__class__.__name__!r} has no attribute {name!r}")
 
+    # Frequently used project and part properties are forwarded explicitly
+    # to avoid the attribute cascading overhead.
+
+    @property
+    def application_name(self) -> str:
+        """Return the name of the application using craft-parts."""
+        return self._part_info.application_name
+
+    @property
+    def cache_dir(self) -> Path:
+        """Return the directory used to store cached files."""
+        return self._part_info.cache_dir
+
+    @property
+    def arch_triplet(self) -> str:
+        """Return the machine-vendor-os platform triplet definition."""
+        return self._part_info.arch_triplet
+
+    @property
+    def target_arch(self) -> str:
+        """Return the architecture used for debs, snaps and charms."""
+        return self._part_info.target_arch
+
+    @property
+    def parallel_build_count(self) -> int:
+        """Return the maximum allowable number of concurrent build jobs."""
+        return self._part_info.parallel_build_count
+
+    @property
+    def project_options(self) -> Dict[str, Any]:
+        """Obtain a project-wide options dictionary."""
+        return self._part_info.project_options
+
+    @property
+    def stage_dir(self) -> Path:
+        """Return the staging area containing installed files from all parts."""
+        return self._part_info.stage_dir
+
+    @property
+    def prime_dir(self) -> Path:
+        """Return the primed tree containing the final artifacts to deploy."""
+        return self._part_info.prime_dir
+
+    @property
+    def part_name(self) -> str:
+        """Return the name of the part we're providing information about."""
+        return self._part_info.part_name
+
+    @property
+    def part_src_dir(self) -> Path:
+        """Return the subdirectory containing the part's source code."""
+        return self._part_info.part_src_dir
+
+    @property
+    def part_build_dir(self) -> Path:
+        """Return the subdirectory containing the part's build tree."""
+        return self._part_info.part_build_dir
+
+    @property
+    def part_build_subdir(self) -> Path:
+        """Return the subdirectory in build containing the source subtree (if any)."""
+        return self._part_info.part_build_subdir
+
+    @property
+    def part_install_dir(self) -> Path:
+        """Return the subdirectory to install the part's build artifacts."""
+        return self._part_info.part_install_dir
+
     def set_custom_argument(self, name: str, value: str) -> None:
         """Set the value of a custom argument.
 
@@ -270,71 +412,74 @@ class StepInfo:
         self._part_info.set_custom_argument(name, value)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_host_architecture() -> str:
     """Obtain the host system architecture."""
     # TODO: handle Windows architectures
     return platform.machine()
 
 
-_ARCH_TRANSLATIONS: Dict[str, Dict[str, Any]] = {
-    "aarch64": {
-        "kernel": "arm64",
-        "deb": "arm64",
-        "uts_machine": "aarch64",
-        "cross-compiler-prefix": "aarch64-linux-gnu-",
-        "triplet": "aarch64-linux-gnu",
-        "core-dynamic-linker": "lib/ld-linux-aarch64.so.1",
-    },
-    "armv7l": {
-        "kernel": "arm",
-        "deb": "armhf",
-        "uts_machine": "arm",
-        "cross-compiler-prefix": "arm-linux-gnueabihf-",
-        "triplet": "arm-linux-gnueabihf",
-        "core-dynamic-linker": "lib/ld-linux-armhf.so.3",
-    },
-    "i686": {
-        "kernel": "x86",
-        "deb": "i386",
-        "uts_machine": "i686",
-        "triplet": "i386-linux-gnu",
-    },
-    "ppc": {
-        "kernel": "powerpc",
-        "deb": "powerpc",
-        "uts_machine": "powerpc",
-        "cross-compiler-prefix": "powerpc-linux-gnu-",
-        "triplet": "powerpc-linux-gnu",
-    },
-    "ppc64le": {
-        "kernel": "powerpc",
-        "deb": "ppc64el",
-        "uts_machine": "ppc64el",
-        "cross-compiler-prefix": "powerpc64le-linux-gnu-",
-        "triplet": "powerpc64le-linux-gnu",
-        "core-dynamic-linker": "lib64/ld64.so.2",
-    },
-    "riscv64": {
-        "kernel": "riscv64",
-        "deb": "riscv64",
-        "uts_machine": "riscv64",
-        "cross-compiler-prefix": "riscv64-linux-gnu-",
-        "triplet": "riscv64-linux-gnu",
-        "core-dynamic-linker": "lib/ld-linux-riscv64-lp64d.so.1",
-    },
-    "s390x": {
-        "kernel": "s390",
-        "deb": "s390x",
-        "uts_machine": "s390x",
-        "cross-compiler-prefix": "s390x-linux-gnu-",
-        "triplet": "s390x-linux-gnu",
-        "core-dynamic-linker": "lib/ld64.so.1",
-    },
-    "x86_64": {
-        "kernel": "x86",
-        "deb": "amd64",
-        "uts_machine": "x86_64",
-        "triplet": "x86_64-linux-gnu",
-        "core-dynamic-linker": "lib64/ld-linux-x86-64.so.2",
-    },
-}
+_ARCH_TRANSLATIONS: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        "aarch64": {
+            "kernel": "arm64",
+            "deb": "arm64",
+            "uts_machine": "aarch64",
+            "cross-compiler-prefix": "aarch64-linux-gnu-",
+            "triplet": "aarch64-linux-gnu",
+            "core-dynamic-linker": "lib/ld-linux-aarch64.so.1",
+        },
+        "armv7l": {
+            "kernel": "arm",
+            "deb": "armhf",
+            "uts_machine": "arm",
+            "cross-compiler-prefix": "arm-linux-gnueabihf-",
+            "triplet": "arm-linux-gnueabihf",
+            "core-dynamic-linker": "lib/ld-linux-armhf.so.3",
+        },
+        "i686": {
+            "kernel": "x86",
+            "deb": "i386",
+            "uts_machine": "i686",
+            "triplet": "i386-linux-gnu",
+        },
+        "ppc": {
+            "kernel": "powerpc",
+            "deb": "powerpc",
+            "uts_machine": "powerpc",
+            "cross-compiler-prefix": "powerpc-linux-gnu-",
+            "triplet": "powerpc-linux-gnu",
+        },
+        "ppc64le": {
+            "kernel": "powerpc",
+            "deb": "ppc64el",
+            "uts_machine": "ppc64el",
+            "cross-compiler-prefix": "powerpc64le-linux-gnu-",
+            "triplet": "powerpc64le-linux-gnu",
+            "core-dynamic-linker": "lib64/ld64.so.2",
+        },
+        "riscv64": {
+            "kernel": "riscv64",
+            "deb": "riscv64",
+            "uts_machine": "riscv64",
+            "cross-compiler-prefix": "riscv64-linux-gnu-",
+            "triplet": "riscv64-linux-gnu",
+            "core-dynamic-linker": "lib/ld-linux-riscv64-lp64d.so.1",
+        },
+        "s390x": {
+            "kernel": "s390",
+            "deb": "s390x",
+            "uts_machine": "s390x",
+            "cross-compiler-prefix": "s390x-linux-gnu-",
+            "triplet": "s390x-linux-gnu",
+            "core-dynamic-linker": "lib/ld64.so.1",
+        },
+        "x86_64": {
+            "kernel": "x86",
+            "deb": "amd64",
+            "uts_machine": "x86_64",
+            "triplet": "x86_64-linux-gnu",
+            "core-dynamic-linker": "lib64/ld-linux-x86-64.so.2",
+        },
+    }
+)
@@ -16,8 +16,8 @@
 
 """Definitions and helpers to handle plugins."""
 
-import copy
-from typing import TYPE_CHECKING, Any, Dict, Type
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Type
 
 from .autotools_plugin import AutotoolsPlugin
 from .base import Plugin
@@ -36,15 +36,18 @@ PluginType = Type[Plugin]
 
 
 # Plugin registry by plugin API version
-_BUILTIN_PLUGINS: Dict[str, PluginType] = {
-    "autotools": AutotoolsPlugin,
-    "dump": DumpPlugin,
-    "make": MakePlugin,
-    "nil": NilPlugin,
-    "python": PythonPlugin,
-}
+_BUILTIN_PLUGINS: Mapping[str, PluginType] = MappingProxyType(
+    {
+        "autotools": AutotoolsPlugin,
+        "dump": DumpPlugin,
+        "make": MakePlugin,
+        "nil": NilPlugin,
+        "python": PythonPlugin,
+    }
+)
 
-_PLUGINS = copy.deepcopy(_BUILTIN_PLUGINS)
+# Plugins registered by the application, taking precedence over builtins
+_USER_PLUGINS: Dict[str, PluginType] = {}
 
 
 def get_plugin(
@@ -76,10 +79,11 @@ def get_plugin_class(name: str) -> PluginType:
 
     :raise ValueError: If the plugin name is invalid.
     """
-    if name not in _PLUGINS:
+    plugin_class = _USER_PLUGINS.get(name) or _BUILTIN_PLUGINS.get(name)
+    if not plugin_class:
         raise ValueError(f"plugin not registered: {name!r}")
 
-    return _PLUGINS[name]
+    return plugin_class
 
 
 def register(plugins: Dict[str, PluginType]) -> None:
@@ -88,13 +92,12 @@ def register(plugins: Dict[str, PluginType]) -> None:
     :param plugins: a dictionary where the keys are plugin names and values
         are plugin classes. Valid plugins must subclass class:`Plugin`.
     """
-    _PLUGINS.update(plugins)
+    _USER_PLUGINS.update(plugins)
 
 
 def unregister_all() -> None:
     """Unregister all user-registered plugins."""
-    global _PLUGINS  # pylint: disable=global-statement
-    _PLUGINS = copy.deepcopy(_BUILTIN_PLUGINS)
+    _USER_PLUGINS.clear()
 
 
 def strip_plugin_properties(data: Dict[str, Any], *, plugin_name: str) -> None:
@@ -104,6 +107,6 @@ def strip_plugin_properties(data: Dict[str, Any], *, plugin_name: str) -> None:
     :param plugin_name: The name of the plugin.
     """
     prefix = f"{plugin_name}-"
-    for key in list(data):
-        if key.startswith(prefix):
-            del data[key]
+    plugin_keys = [key for key in data if key.startswith(prefix)]
+    for key in plugin_keys:
+        del data[key]
@@ -16,6 +16,7 @@
 
 """The step state preserves step execution context information."""
 
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, Set
@@ -104,10 +105,16 @@ class StepState(YamlModel, ABC):
         return self.dict(by_alias=True)
 
     def write(self, filepath: Path) -> None:
-        """Write this state to disk."""
+        """Write this state to disk.
+
+        The state is written to a temporary file that atomically replaces
+        the destination, so readers never see a partially written state.
+        """
         filepath.parent.mkdir(parents=True, exist_ok=True)
         yaml_data = self.yaml(by_alias=True)
-        os_utils.TimedWriter.write_text(filepath, yaml_data)
+        tmp_path = filepath.with_name(f"{filepath.name}.tmp.{os.getpid()}")
+        os_utils.TimedWriter.write_text(tmp_path, yaml_data)
+        os.replace(tmp_path, filepath)
 
 
 def _get_differing_keys(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Set[str]:
@@ -68,6 +68,7 @@ test_requires = [
     "pylint-pytest",
     "pytest",
     "pytest-mock",
+    "pytest-xdist",
     "requests-mock",
     "tox",
     "types-PyYAML",
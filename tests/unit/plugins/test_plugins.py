@@ -137,6 +137,13 @@ class TestPluginRegistry:
         with pytest.raises(ValueError):
             plugins.get_plugin_class("foo")
 
+    def test_register_overrides_builtin(self):
+        plugins.register({"make": FooPlugin})
+        assert plugins.get_plugin_class("make") == FooPlugin
+
+        plugins.unregister_all()
+        assert plugins.get_plugin_class("make") == MakePlugin
+
 
 class TestHelpers:
     """Verify plugin helper functions."""
@@ -98,6 +98,17 @@ class TestStepStatePersist:
         new_state = yaml.safe_load(content)
         assert new_state == state.marshal()
 
+    def test_write_replaces_existing(self):
+        Path("state").write_text("old content")
+        state = SomeStepState(part_properties={"name": "foo"})
+
+        state.write(Path("state"))
+        with open("state") as f:
+            content = f.read()
+
+        assert yaml.safe_load(content) == state.marshal()
+        assert sorted(p.name for p in Path().iterdir()) == ["state"]
+
 
 class TestStateChanges:
     """Verify state comparison methods."""
@@ -18,7 +18,7 @@ from pathlib import Path
 
 import pytest
 
-from craft_parts import errors
+from craft_parts import errors, infos
 from craft_parts.dirs import ProjectDirs
 from craft_parts.infos import PartInfo, ProjectInfo, StepInfo
 from craft_parts.parts import Part
@@ -27,6 +27,14 @@ from craft_parts.steps import Step
 _MOCK_NATIVE_ARCH = "aarch64"
 
 
+@pytest.fixture(autouse=True)
+def clear_host_arch_cache():
+    """Don't leak the memoized host architecture between tests."""
+    infos._get_host_architecture.cache_clear()
+    yield
+    infos._get_host_architecture.cache_clear()
+
+
 @pytest.mark.parametrize(
     "tc_arch,tc_target_arch,tc_triplet,tc_cross",
     [
@@ -125,6 +133,15 @@ def test_invalid_arch():
     assert raised.value.arch_name == "invalid"
 
 
+def test_host_arch_is_cached(mocker):
+    mock_machine = mocker.patch("platform.machine", return_value=_MOCK_NATIVE_ARCH)
+
+    ProjectInfo(application_name="test", cache_dir=Path())
+    ProjectInfo(application_name="test", cache_dir=Path())
+
+    mock_machine.assert_called_once()
+
+
 def test_part_info(new_dir):
     info = ProjectInfo(
         application_name="test", cache_dir=Path(), custom1="foobar", custom2=[1, 2]